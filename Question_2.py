@@ -1,6 +1,111 @@
+import base64
+import heapq
+import json
+import math
+import multiprocessing
+import multiprocessing.util
+import os
+import random
+import time
+import tracemalloc
+from array import array
+from collections import Counter, deque
+from multiprocessing import shared_memory
+
+# Constants for pagination
+DEFAULT_PAGE_SIZE = 10  # How many entries one page shows by default
+MAX_PAGE_SIZE = 100  # Upper limit for a single page request
+
+# Constants for graph algorithms
+LABEL_PROPAGATION_MAX_ROUNDS = 20  # Stop community detection after this many rounds
+GRAPH_RANDOM_SEED = 42  # Seed so community detection and benchmarks are repeatable
+CLUSTER_BENCHMARK_SIZES = [1_000, 10_000, 100_000]  # Vertex counts to benchmark
+CLUSTER_BENCHMARK_DEGREE = 5  # Average number of accounts each user follows
+
+# Constants for parallel analytics
+PARTITIONS_PER_WORKER = 4  # Smaller partitions balance uneven work between processes
+RECOMMENDATIONS_PER_USER = 3  # How many "people you may know" to suggest
+SCALING_BENCHMARK_VERTICES = 20_000  # Graph size for the core count benchmark
+
+# Constants for the synthetic graph benchmark suite
+FOLLOWS_PER_NEW_USER = 5  # Edges added by each new user in the power-law generator
+FOLLOW_BACK_PROBABILITY = 0.3  # Chance that a followed user follows back
+SUITE_EDGE_COUNTS = [10**3, 10**4, 10**5, 10**6]  # Graph sizes (in edges) to benchmark
+SUITE_LARGE_EDGE_COUNTS = [10**7]  # Opt-in sizes (about 10 GB of memory)
+SUITE_SAMPLE_OPERATIONS = 10_000  # Random operations timed for each query type
+
+# Constants for name search
+AUTOCOMPLETE_LIMIT = 10  # Most suggestions a name search can return
+
+
+# Helpers for cursor-based pagination
+# Paged lists are kept sorted by an integer key (a sequence number or a
+# vertex position). A cursor is the key of the last item returned, so a
+# page is found with a binary search plus a slice - O(log n + page size).
+def first_after(items, after, key):
+    # Position of the first item whose key is greater than `after`
+    low, high = 0, len(items)
+    while low < high:
+        middle = (low + high) // 2
+        if key(items[middle]) <= after:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def insert_sorted(items, item, key):
+    # Insert item into a list that is sorted by key
+    items.insert(first_after(items, key(item), key), item)
+
+
+def remove_sorted(items, item, key):
+    # Remove item from a list that is sorted by key (keys are unique integers)
+    del items[first_after(items, key(item) - 1, key)]
+
+
+def take_page(items, after, limit, key):
+    # Return (page, key_of_last_item_or_None) for the page after a key
+    start = 0 if after is None else first_after(items, after, key)
+    end = start + limit
+
+    # Only hand back a cursor if there is something after this page
+    next_key = key(items[end - 1]) if end < len(items) else None
+    return items[start:end], next_key
+
+
+def encode_cursor(seq):
+    # Turn a sequence number into an opaque cursor string
+    if seq is None:
+        return None
+    return base64.urlsafe_b64encode(f"seq:{seq}".encode()).decode()
+
+
+def decode_cursor(cursor):
+    # Turn an opaque cursor string back into a sequence number
+    if cursor is None:
+        return None
+    if not isinstance(cursor, str):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    try:
+        prefix, seq = base64.urlsafe_b64decode(cursor.encode()).decode().split(":")
+        if prefix != "seq":
+            raise ValueError
+        return int(seq)
+    except ValueError:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+
+
+def check_page_size(limit):
+    # Validate a requested page size and cap it at MAX_PAGE_SIZE
+    if limit < 1:
+        raise ValueError("Page size must be at least 1")
+    return min(limit, MAX_PAGE_SIZE)
+
+
 # QUESTION 2.1: Unweighted Directed Graph Data Structure
 class Graph:
-    def __init__(self):
+    def __init__(self, group_key=None):
         # Dictionary to store vertex data: {vertex_id: vertex_data_object}
         self.vertices = {}
 
@@ -8,11 +113,47 @@ class Graph:
         # This represents OUTGOING edges (who this vertex follows)
         self.edges = {}
 
+        # Vertices in insertion order, and each vertex's index in that list
+        # (vertices are never removed, so positions do not change)
+        self.vertex_order = []
+        self.vertex_position = {}
+
+        # {vertex_id: {neighbour: sequence number}} - when each outgoing edge
+        # was added, in the same order as self.edges. Gives O(1) duplicate
+        # checks and stable cursors. Created on a vertex's first edge.
+        self.edge_seq = {}
+        self.next_edge_seq = 0
+
+        # INCOMING edges: {vertex_id: [followers]} sorted by vertex position,
+        # so followers can be listed without checking every vertex in the
+        # graph. Created on a vertex's first follower.
+        self.incoming = {}
+
+        # Optional function mapping vertex data to a group (e.g. privacy)
+        # so paged queries can be filtered without a full scan. Filtered
+        # lists are only kept when group_key is set, and only created once
+        # they get their first entry:
+        #   ("vertices", group), ("out", vertex_id, group), ("in", vertex_id, group)
+        self.group_key = group_key
+        self.grouped = {}
+
+    def vertex_group(self, vertex_id):
+        # Group of a vertex according to group_key (None if not grouped)
+        if self.group_key is None:
+            return None
+        return self.group_key(self.vertices[vertex_id])
+
     def add_vertex(self, vertex_id, vertex_data):
         # Only add if vertex doesn't already exist
         if vertex_id not in self.vertices:
             self.vertices[vertex_id] = vertex_data
             self.edges[vertex_id] = []  # Initialize empty edge list
+            self.vertex_position[vertex_id] = len(self.vertex_order)
+            self.vertex_order.append(vertex_id)
+
+            if self.group_key is not None:
+                key = ("vertices", self.vertex_group(vertex_id))
+                self.grouped.setdefault(key, []).append(vertex_id)
             return True
         return False
 
@@ -20,16 +161,41 @@ class Graph:
         # Create a directed edge from one vertex to another
         # Both vertices must exist first
         if from_vertex in self.vertices and to_vertex in self.vertices:
-            # Avoid duplicate edges
-            if to_vertex not in self.edges[from_vertex]:
+            seqs = self.edge_seq.get(from_vertex)
+            if seqs is None:
+                seqs = self.edge_seq[from_vertex] = {}
+
+            # Avoid duplicate edges (O(1) check through the sequence map)
+            if to_vertex not in seqs:
+                seqs[to_vertex] = self.next_edge_seq
+                self.next_edge_seq += 1
                 self.edges[from_vertex].append(to_vertex)
+                position = self.vertex_position.__getitem__
+                insert_sorted(self.incoming.setdefault(to_vertex, []), from_vertex, position)
+
+                if self.group_key is not None:
+                    key = ("out", from_vertex, self.vertex_group(to_vertex))
+                    self.grouped.setdefault(key, []).append(to_vertex)
+                    key = ("in", to_vertex, self.vertex_group(from_vertex))
+                    insert_sorted(self.grouped.setdefault(key, []), from_vertex, position)
                 return True
         return False
 
     def remove_edge(self, from_vertex, to_vertex):
         # Remove a directed edge between two vertices
-        if from_vertex in self.vertices and to_vertex in self.edges[from_vertex]:
+        seqs = self.edge_seq.get(from_vertex)
+        if seqs is not None and to_vertex in seqs:
             self.edges[from_vertex].remove(to_vertex)
+            position = self.vertex_position.__getitem__
+            remove_sorted(self.incoming[to_vertex], from_vertex, position)
+
+            if self.group_key is not None:
+                key = ("out", from_vertex, self.vertex_group(to_vertex))
+                remove_sorted(self.grouped[key], to_vertex, seqs.__getitem__)
+                key = ("in", to_vertex, self.vertex_group(from_vertex))
+                remove_sorted(self.grouped[key], from_vertex, position)
+
+            del seqs[to_vertex]
             return True
         return False
 
@@ -42,17 +208,18 @@ class Graph:
 
     def list_incoming_adjacent_vertices(self, vertex_id):
         # Return list of vertices that connect TO this vertex
-        # (people who follow this user)
-        incoming = []
+        # (people who follow this user), in the order the vertices were added
+        # The incoming lists are kept up to date by add_edge/remove_edge,
+        # so there is no need to check every vertex in the graph
+        return list(self.incoming.get(vertex_id, []))
 
-        # Check every vertex in the graph
-        for vertex, adjacent_list in self.edges.items():
-            # If this vertex appears in another vertex's edge list,
-            # it means that vertex has an edge pointing TO this one
-            if vertex_id in adjacent_list:
-                incoming.append(vertex)
+    def out_degree(self, vertex_id):
+        # Number of vertices this vertex connects TO
+        return len(self.edges.get(vertex_id, []))
 
-        return incoming
+    def in_degree(self, vertex_id):
+        # Number of vertices that connect TO this vertex
+        return len(self.incoming.get(vertex_id, []))
 
     def get_vertex_data(self, vertex_id):
         # Retrieve the data object associated with a vertex
@@ -62,6 +229,158 @@ class Graph:
         # Get list of all vertex IDs in the graph
         return list(self.vertices.keys())
 
+    # Cursor-based pagination: each method returns (page, next_cursor).
+    # next_cursor is None on the last page. Pass group (e.g. "public") to
+    # only include vertices in that group (needs group_key).
+    def check_group(self, group):
+        # A group filter on an ungrouped graph would always look empty
+        if group is not None and self.group_key is None:
+            raise ValueError("Filtering by group needs a Graph with group_key")
+
+    def get_vertices_page(self, cursor=None, limit=DEFAULT_PAGE_SIZE, group=None):
+        # One page of the vertex directory in insertion order
+        limit = check_page_size(limit)
+        self.check_group(group)
+        items = self.vertex_order if group is None else self.grouped.get(("vertices", group), [])
+        page, next_key = take_page(items, decode_cursor(cursor), limit, self.vertex_position.__getitem__)
+        return page, encode_cursor(next_key)
+
+    def get_outgoing_page(self, vertex_id, cursor=None, limit=DEFAULT_PAGE_SIZE, group=None):
+        # One page of the vertices this vertex connects TO, oldest edge first
+        limit = check_page_size(limit)
+        self.check_group(group)
+        if vertex_id not in self.edge_seq:
+            return [], None
+        items = self.edges[vertex_id] if group is None else self.grouped.get(("out", vertex_id, group), [])
+        page, next_key = take_page(items, decode_cursor(cursor), limit, self.edge_seq[vertex_id].__getitem__)
+        return page, encode_cursor(next_key)
+
+    def get_incoming_page(self, vertex_id, cursor=None, limit=DEFAULT_PAGE_SIZE, group=None):
+        # One page of the vertices that connect TO this vertex, in vertex order
+        limit = check_page_size(limit)
+        self.check_group(group)
+        if group is None:
+            items = self.incoming.get(vertex_id, [])
+        else:
+            items = self.grouped.get(("in", vertex_id, group), [])
+        page, next_key = take_page(items, decode_cursor(cursor), limit, self.vertex_position.__getitem__)
+        return page, encode_cursor(next_key)
+
+    def strongly_connected_components(self):
+        # Tarjan's algorithm: returns {vertex_id: component_id}
+        # Two vertices share a component if each can reach the other.
+        # Uses an explicit stack instead of recursion so very large graphs
+        # do not hit Python's recursion limit. O(V + E) time.
+        index = {}  # Order in which each vertex was first visited
+        low = {}  # Lowest index reachable from the vertex's subtree
+        on_stack = set()
+        stack = []  # Vertices of components that are not finished yet
+        component = {}
+        counter = 0
+        component_id = 0
+
+        for root in self.vertices:
+            if root in index:
+                continue
+
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+
+            # Each work entry is (vertex, iterator over its outgoing edges)
+            work = [(root, iter(self.edges[root]))]
+
+            while work:
+                vertex, neighbours = work[-1]
+
+                for neighbour in neighbours:
+                    if neighbour not in index:
+                        # Tree edge - "recurse" by pushing a new work entry
+                        index[neighbour] = low[neighbour] = counter
+                        counter += 1
+                        stack.append(neighbour)
+                        on_stack.add(neighbour)
+                        work.append((neighbour, iter(self.edges[neighbour])))
+                        break
+                    elif neighbour in on_stack:
+                        # Back edge into the current component
+                        low[vertex] = min(low[vertex], index[neighbour])
+                else:
+                    # All edges explored - "return" to the parent
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[vertex])
+
+                    # vertex is the root of a component - pop the whole component
+                    if low[vertex] == index[vertex]:
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component[member] = component_id
+                            if member == vertex:
+                                break
+                        component_id += 1
+
+        return component
+
+    def detect_communities(self, max_rounds=LABEL_PROPAGATION_MAX_ROUNDS, seed=GRAPH_RANDOM_SEED):
+        # Label propagation: returns {vertex_id: community_id}
+        # Every vertex starts in its own community, then repeatedly adopts the
+        # most common label among its neighbours (follow direction ignored).
+        # Stops when no label changes or after max_rounds. O(E) per round.
+        rng = random.Random(seed)
+        labels = {vertex: i for i, vertex in enumerate(self.vertices)}
+        order = list(self.vertices)
+
+        for _ in range(max_rounds):
+            rng.shuffle(order)
+            changed = False
+
+            for vertex in order:
+                # Count labels of everyone this vertex follows or is followed by
+                counts = {}
+                for neighbour in self.edges[vertex]:
+                    label = labels[neighbour]
+                    counts[label] = counts.get(label, 0) + 1
+                for neighbour in self.incoming.get(vertex, []):
+                    label = labels[neighbour]
+                    counts[label] = counts.get(label, 0) + 1
+
+                if not counts:
+                    continue  # Isolated vertex keeps its own label
+
+                best = max(counts.values())
+                # Keep the current label on a tie so the process settles
+                if counts.get(labels[vertex]) == best:
+                    continue
+                candidates = [label for label, count in counts.items() if count == best]
+                labels[vertex] = rng.choice(candidates)
+                changed = True
+
+            if not changed:
+                break
+
+        # Renumber labels as 0, 1, 2, ... in order of first appearance
+        renumbered = {}
+        communities = {}
+        for vertex in self.vertices:
+            label = labels[vertex]
+            if label not in renumbered:
+                renumbered[label] = len(renumbered)
+            communities[vertex] = renumbered[label]
+
+        return communities
+
+
+def group_by_component(assignment):
+    # Turn {vertex_id: component_id} into a list of member lists
+    groups = {}
+    for vertex, component_id in assignment.items():
+        groups.setdefault(component_id, []).append(vertex)
+    return list(groups.values())
+
 
 # QUESTION 2.2: Person Entity Class
 class Person:
@@ -82,10 +401,60 @@ class Person:
         return self.name
 
 
+# Trie for case-insensitive name autocomplete
+class TrieNode:
+    def __init__(self):
+        self.children = {}  # {character: TrieNode}
+        self.names = {}  # {name: score} for names ending exactly here
+        self.top = []  # Best (-score, name) pairs in this subtree, sorted
+
+
+class NameTrie:
+    # Prefix search over names, ranked by a score (follower count).
+    # Every node caches the AUTOCOMPLETE_LIMIT best names below it, so a
+    # search only walks the prefix and slices that cache: O(prefix + k),
+    # no matter how many names are stored. Changing a score rebuilds the
+    # caches along that name's path: O(name length x children x limit).
+
+    def __init__(self):
+        self.root = TrieNode()
+
+    def update(self, name, score):
+        # Insert a name, or change the score of an existing one
+        node = self.root
+        path = [node]
+        for character in name.lower():
+            if character not in node.children:
+                node.children[character] = TrieNode()
+            node = node.children[character]
+            path.append(node)
+
+        node.names[name] = score
+
+        # Rebuild the cached top lists from the bottom up
+        for node in reversed(path):
+            candidates = [(-score, name) for name, score in node.names.items()]
+            for child in node.children.values():
+                candidates.extend(child.top)
+            node.top = heapq.nsmallest(AUTOCOMPLETE_LIMIT, candidates)
+
+    def autocomplete(self, prefix, k=AUTOCOMPLETE_LIMIT):
+        # Up to k names starting with prefix (any case), highest score first
+        node = self.root
+        for character in prefix.lower():
+            node = node.children.get(character)
+            if node is None:
+                return []
+        return [name for _, name in node.top[:k]]
+
+
 # QUESTION 2.3 & 2.4: Social Media Application
 class SocialMediaApp:
     def __init__(self):
-        self.graph = Graph()
+        # Group vertices by privacy so paged lists can skip private profiles
+        self.graph = Graph(group_key=lambda person: person.privacy)
+        # Names ranked by follower count for autocomplete
+        self.name_index = NameTrie()
         self.initialize_profiles()
 
     def initialize_profiles(self):
@@ -107,6 +476,7 @@ class SocialMediaApp:
         # Add each person as a vertex in the graph
         for person in profiles:
             self.graph.add_vertex(person.name, person)
+            self.name_index.update(person.name, 0)
             print(f"✓ Created profile: {person.name}")
 
         # Create initial follow relationships (directed edges)
@@ -134,10 +504,84 @@ class SocialMediaApp:
         # Add each relationship as a directed edge
         for follower, following in follow_relationships:
             self.graph.add_edge(follower, following)
+            self.update_follower_count(following)
             print(f"✓ {follower} is now following {following}")
 
         print(f"\n✓ Successfully initialized {len(profiles)} profiles!")
 
+    # ===================================================================
+    # PAGINATED QUERIES
+    # ===================================================================
+
+    # Each query returns (page_of_names, next_cursor). Pass next_cursor back
+    # in to get the following page; it is None once the list is exhausted.
+    # public_only=True leaves out private profiles.
+
+    def get_users_page(self, cursor=None, limit=DEFAULT_PAGE_SIZE, public_only=False):
+        group = "public" if public_only else None
+        return self.graph.get_vertices_page(cursor, limit, group)
+
+    def get_following_page(self, user_name, cursor=None, limit=DEFAULT_PAGE_SIZE, public_only=False):
+        group = "public" if public_only else None
+        return self.graph.get_outgoing_page(user_name, cursor, limit, group)
+
+    def get_followers_page(self, user_name, cursor=None, limit=DEFAULT_PAGE_SIZE, public_only=False):
+        group = "public" if public_only else None
+        return self.graph.get_incoming_page(user_name, cursor, limit, group)
+
+    def print_paged(self, fetch_page):
+        # Print a list one page at a time, asking before showing the next page
+        # fetch_page(cursor) must return (page, next_cursor)
+        # Returns how many entries were printed
+        cursor = None
+        count = 0
+
+        while True:
+            page, cursor = fetch_page(cursor)
+            for user in page:
+                count += 1
+                print(f"{count}.) {user}")
+
+            if cursor is None:
+                return count
+
+            more = input("-- Press Enter for more, or 'q' to stop: ")
+            if more.lower() == "q":
+                return count
+
+    # ===================================================================
+    # NAME SEARCH
+    # ===================================================================
+
+    def update_follower_count(self, user_name):
+        # Keep the autocomplete ranking in step with the follower count
+        self.name_index.update(user_name, self.graph.in_degree(user_name))
+
+    def search_users(self, prefix, k=AUTOCOMPLETE_LIMIT):
+        # Names starting with prefix (case-insensitive), most followed first
+        return self.name_index.autocomplete(prefix, min(k, AUTOCOMPLETE_LIMIT))
+
+    def ask_for_user(self, prompt):
+        # Ask for a user name; if it does not match exactly, offer the
+        # closest autocomplete suggestions to pick from
+        user_name = input(prompt)
+        if user_name in self.graph.vertices or not user_name:
+            return user_name
+
+        suggestions = self.search_users(user_name)
+        if not suggestions:
+            return user_name
+
+        print("\nDid you mean:")
+        for i, suggestion in enumerate(suggestions, 1):
+            followers = self.graph.in_degree(suggestion)
+            print(f"{i}.) {suggestion} ({followers} followers)")
+
+        choice = input("Enter a number (or press Enter to keep what you typed): ")
+        if choice.isdigit() and 1 <= int(choice) <= len(suggestions):
+            return suggestions[int(choice) - 1]
+        return user_name
+
     # ===================================================================
     # MANDATORY FEATURES (a-d)
     # ===================================================================
@@ -148,9 +592,7 @@ class SocialMediaApp:
         print("ALL USERS")
         print("=" * 70)
 
-        users = self.graph.get_all_vertices()
-        for i, user in enumerate(users, 1):
-            print(f"{i}.) {user}")
+        self.print_paged(lambda cursor: self.get_users_page(cursor))
 
         print("=" * 70)
 
@@ -162,7 +604,7 @@ class SocialMediaApp:
 
         self.display_all_users()
 
-        user_name = input("\nEnter the name of user to view: ")
+        user_name = self.ask_for_user("\nEnter the name of user to view: ")
         person = self.graph.get_vertex_data(user_name)
 
         if person:
@@ -180,21 +622,20 @@ class SocialMediaApp:
 
         self.display_all_users()
 
-        user_name = input("\nEnter the name of user: ")
+        user_name = self.ask_for_user("\nEnter the name of user: ")
 
         # Check if user exists
         if user_name not in self.graph.vertices:
             print(f"\n✗ User '{user_name}' not found!")
             return
 
-        # Get outgoing edges (people this user follows)
-        following_list = self.graph.list_outgoing_adjacent_vertices(user_name)
+        # Get outgoing edges (people this user follows), one page at a time
+        total = self.graph.out_degree(user_name)
 
         print(f"\n--- {user_name}'s Following List ---")
-        if following_list:
-            for i, followed_user in enumerate(following_list, 1):
-                print(f"{i}.) {followed_user}")
-            print(f"\nTotal: {len(following_list)} accounts")
+        if total:
+            self.print_paged(lambda cursor: self.get_following_page(user_name, cursor))
+            print(f"\nTotal: {total} accounts")
         else:
             print(f"{user_name} is not following anyone.")
         print("-" * 70)
@@ -207,21 +648,20 @@ class SocialMediaApp:
 
         self.display_all_users()
 
-        user_name = input("\nEnter the name of user: ")
+        user_name = self.ask_for_user("\nEnter the name of user: ")
 
         # Check if user exists
         if user_name not in self.graph.vertices:
             print(f"\n✗ User '{user_name}' not found!")
             return
 
-        # Get incoming edges (people who follow this user)
-        followers_list = self.graph.list_incoming_adjacent_vertices(user_name)
+        # Get incoming edges (people who follow this user), one page at a time
+        total = self.graph.in_degree(user_name)
 
         print(f"\n--- {user_name}'s Followers ---")
-        if followers_list:
-            for i, follower in enumerate(followers_list, 1):
-                print(f"{i}.) {follower}")
-            print(f"\nTotal: {len(followers_list)} followers")
+        if total:
+            self.print_paged(lambda cursor: self.get_followers_page(user_name, cursor))
+            print(f"\nTotal: {total} followers")
         else:
             print(f"{user_name} has no followers.")
         print("-" * 70)
@@ -254,6 +694,7 @@ class SocialMediaApp:
         # Create new person object and add to graph
         new_person = Person(name, gender, biography, privacy)
         self.graph.add_vertex(name, new_person)
+        self.name_index.update(name, 0)
 
         print(f"\n✓ Successfully created profile for {name}!")
 
@@ -266,7 +707,7 @@ class SocialMediaApp:
         self.display_all_users()
 
         # Get the follower (person who wants to follow)
-        follower = input("\nWho wants to follow someone? Enter name: ")
+        follower = self.ask_for_user("\nWho wants to follow someone? Enter name: ")
 
         # Validate follower exists
         if follower not in self.graph.vertices:
@@ -274,7 +715,7 @@ class SocialMediaApp:
             return
 
         # Get the person to follow
-        to_follow = input(f"Who should {follower} follow? Enter name: ")
+        to_follow = self.ask_for_user(f"Who should {follower} follow? Enter name: ")
 
         # Validate user to follow exists
         if to_follow not in self.graph.vertices:
@@ -296,6 +737,7 @@ class SocialMediaApp:
         success = self.graph.add_edge(follower, to_follow)
 
         if success:
+            self.update_follower_count(to_follow)
             print(f"\n✓ Success! {follower} is now following {to_follow}")
         else:
             print(f"\n✗ Failed to create follow relationship")
@@ -309,7 +751,7 @@ class SocialMediaApp:
         self.display_all_users()
 
         # Get the unfollower
-        unfollower = input("\nWho wants to unfollow someone? Enter name: ")
+        unfollower = self.ask_for_user("\nWho wants to unfollow someone? Enter name: ")
 
         # Validate unfollower exists
         if unfollower not in self.graph.vertices:
@@ -339,10 +781,36 @@ class SocialMediaApp:
         success = self.graph.remove_edge(unfollower, to_unfollow)
 
         if success:
+            self.update_follower_count(to_unfollow)
             print(f"\n✓ Success! {unfollower} has unfollowed {to_unfollow}")
         else:
             print(f"\n✗ Failed to remove follow relationship")
 
+    def view_follow_clusters(self):
+        # EXTRA: Show tight follow clusters in the network
+        print("\n" + "=" * 70)
+        print("FOLLOW CLUSTERS")
+        print("=" * 70)
+
+        # Strongly connected components: everyone can reach everyone else
+        components = group_by_component(self.graph.strongly_connected_components())
+        clusters = [members for members in components if len(members) > 1]
+
+        print("\n--- Mutual Follow Circles ---")
+        if clusters:
+            for i, members in enumerate(clusters, 1):
+                print(f"{i}.) {', '.join(members)}")
+        else:
+            print("No mutual follow circles found.")
+
+        # Communities: groups that are densely connected to each other
+        communities = group_by_component(self.graph.detect_communities())
+
+        print("\n--- Communities ---")
+        for i, members in enumerate(communities, 1):
+            print(f"{i}.) {', '.join(members)}")
+        print("-" * 70)
+
     def run(self):
         # Main menu loop
         while True:
@@ -356,10 +824,11 @@ class SocialMediaApp:
             print("5. Add a new user profile")
             print("6. Follow a user")  
             print("7. Unfollow a user")  
-            print("8. Quit")
+            print("8. View follow clusters")
+            print("9. Quit")
             print("=" * 70)
 
-            choice = input("Enter your choice (1-8): ")
+            choice = input("Enter your choice (1-9): ")
 
             if choice == "1":
                 self.display_all_users()
@@ -376,17 +845,536 @@ class SocialMediaApp:
             elif choice == "7":
                 self.unfollow_user() 
             elif choice == "8":
+                self.view_follow_clusters()
+            elif choice == "9":
                 print("\n✓ Thank you for using Slowgram!")
                 break
             else:
                 print("\n✗ Invalid choice! Please try again.")
 
 
+# Benchmark: Follow Cluster Algorithms on Synthetic Graphs
+def build_random_graph(num_vertices, average_degree, seed=GRAPH_RANDOM_SEED):
+    # Random follow graph where every user follows about average_degree others
+    rng = random.Random(seed)
+    graph = Graph()
+
+    for vertex in range(num_vertices):
+        graph.add_vertex(vertex, None)
+
+    for vertex in range(num_vertices):
+        for _ in range(average_degree):
+            target = rng.randrange(num_vertices)
+            if target != vertex:  # Users cannot follow themselves
+                graph.add_edge(vertex, target)
+
+    return graph
+
+
+def measure(function):
+    # Run function once for timing, then again under tracemalloc for memory
+    # Returns (result, seconds, peak_bytes)
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, elapsed, peak
+
+
+def cluster_benchmark(sizes=CLUSTER_BENCHMARK_SIZES, average_degree=CLUSTER_BENCHMARK_DEGREE):
+    print("\n" + "=" * 70)
+    print("FOLLOW CLUSTER BENCHMARK")
+    print("=" * 70)
+    print(f"Random follow graphs, about {average_degree} follows per user")
+    print("=" * 70)
+
+    results = []
+
+    for num_vertices in sizes:
+        graph = build_random_graph(num_vertices, average_degree)
+        num_edges = sum(len(adjacent) for adjacent in graph.edges.values())
+
+        components, scc_time, scc_peak = measure(graph.strongly_connected_components)
+        communities, lpa_time, lpa_peak = measure(graph.detect_communities)
+
+        print(f"\n{num_vertices:,} vertices, {num_edges:,} edges:")
+        print(f"  SCC:         {scc_time * 1000:10.2f} ms, peak {scc_peak / 1024 / 1024:8.2f} MB, "
+              f"{len(set(components.values())):,} components")
+        print(f"  Communities: {lpa_time * 1000:10.2f} ms, peak {lpa_peak / 1024 / 1024:8.2f} MB, "
+              f"{len(set(communities.values())):,} communities")
+
+        results.append({
+            "vertices": num_vertices,
+            "edges": num_edges,
+            "scc_seconds": scc_time,
+            "scc_peak_bytes": scc_peak,
+            "community_seconds": lpa_time,
+            "community_peak_bytes": lpa_peak,
+        })
+
+    print("=" * 70)
+    return results
+
+
+# Parallel Graph Analytics over Partitioned Vertices
+# The adjacency lists are packed into one shared memory block in CSR form:
+#   offsets[i] .. offsets[i + 1] is the slice of targets that vertex i follows
+# Worker processes attach to the block once when the pool starts, so tasks
+# only carry a vertex range instead of a pickled copy of the graph.
+
+# Set in each worker process by attach_shared_adjacency
+worker_memory = None
+worker_values = None
+worker_offsets = None
+worker_targets = None
+
+
+def attach_shared_adjacency(memory_name, num_vertices, num_edges):
+    # Pool initializer: map the shared CSR arrays into this worker
+    global worker_memory, worker_values, worker_offsets, worker_targets
+
+    try:
+        # Python 3.13+: do not let this process's resource tracker unlink it
+        worker_memory = shared_memory.SharedMemory(name=memory_name, track=False)
+    except TypeError:
+        worker_memory = shared_memory.SharedMemory(name=memory_name)
+
+    worker_values = worker_memory.buf.cast("q")
+    worker_offsets = worker_values[:num_vertices + 1]
+    worker_targets = worker_values[num_vertices + 1:num_vertices + 1 + num_edges]
+
+    # The views must be released before the block can be closed on exit
+    multiprocessing.util.Finalize(worker_memory, detach_shared_adjacency, exitpriority=10)
+
+
+def detach_shared_adjacency():
+    # Release this worker's views of the shared block and close it
+    for view in (worker_offsets, worker_targets, worker_values):
+        view.release()
+    worker_memory.close()
+
+
+def partial_degrees(offsets, targets, start, end, param):
+    # Out-degree of each vertex in the range, and how many times each
+    # target is followed from inside the range (partial in-degree)
+    out_degrees = Counter()
+    in_counts = Counter()
+    for vertex in range(start, end):
+        out_degrees[offsets[vertex + 1] - offsets[vertex]] += 1
+        for position in range(offsets[vertex], offsets[vertex + 1]):
+            in_counts[targets[position]] += 1
+    return out_degrees, in_counts
+
+
+def partial_reachability(offsets, targets, start, end, max_hops):
+    # Breadth-first search from each vertex in the range; counts how many
+    # other vertices it can reach (within max_hops if given)
+    counts = {}
+    for source in range(start, end):
+        seen = {source}
+        queue = deque([(source, 0)])
+        while queue:
+            vertex, hops = queue.popleft()
+            if max_hops is not None and hops == max_hops:
+                continue
+            for position in range(offsets[vertex], offsets[vertex + 1]):
+                target = targets[position]
+                if target not in seen:
+                    seen.add(target)
+                    queue.append((target, hops + 1))
+        counts[source] = len(seen) - 1
+    return counts
+
+
+def partial_recommendations(offsets, targets, start, end, k):
+    # "People you may know": accounts followed by the people a vertex
+    # follows, ranked by how many of them follow that account
+    suggestions = {}
+    for vertex in range(start, end):
+        following = set(targets[offsets[vertex]:offsets[vertex + 1]])
+        scores = Counter()
+        for friend in following:
+            for position in range(offsets[friend], offsets[friend + 1]):
+                candidate = targets[position]
+                if candidate != vertex and candidate not in following:
+                    scores[candidate] += 1
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        suggestions[vertex] = [candidate for candidate, _ in ranked[:k]]
+    return suggestions
+
+
+# Analytic name -> function run on one partition
+PARTITION_ANALYTICS = {
+    "degrees": partial_degrees,
+    "reachability": partial_reachability,
+    "recommendations": partial_recommendations,
+}
+
+
+def run_partition(task):
+    # Pool task: run one analytic on one vertex range using the shared arrays
+    analytic, start, end, param = task
+    return PARTITION_ANALYTICS[analytic](worker_offsets, worker_targets, start, end, param)
+
+
+class ParallelGraphAnalytics:
+    # Runs whole-graph analytics on a pool of processes. Use as a context
+    # manager (or call close()) so the pool and shared memory are released.
+    # workers=0 runs everything in this process, which is useful as a baseline.
+
+    def __init__(self, graph, workers=None):
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+
+        # Give every vertex an integer position for the CSR arrays
+        self.vertex_ids = list(graph.vertices)
+        position_of = {vertex: i for i, vertex in enumerate(self.vertex_ids)}
+
+        offsets = array("q", [0])
+        targets = array("q")
+        for vertex in self.vertex_ids:
+            targets.extend(position_of[target] for target in graph.edges[vertex])
+            offsets.append(len(targets))
+
+        self.num_vertices = len(self.vertex_ids)
+        self.num_edges = len(targets)
+        self.memory = None
+        self.pool = None
+
+        if self.workers == 0:
+            # Sequential mode keeps the arrays in this process
+            self.offsets = offsets
+            self.targets = targets
+            return
+
+        # Copy both arrays into one shared block (at least one slot so an
+        # empty graph still gets a valid block)
+        size = max(len(offsets) + len(targets), 1) * offsets.itemsize
+        self.memory = shared_memory.SharedMemory(create=True, size=size)
+        try:
+            values = self.memory.buf.cast("q")
+            values[:len(offsets)] = offsets
+            values[len(offsets):len(offsets) + len(targets)] = targets
+            values.release()
+
+            self.pool = multiprocessing.Pool(
+                self.workers,
+                initializer=attach_shared_adjacency,
+                initargs=(self.memory.name, self.num_vertices, self.num_edges),
+            )
+        except BaseException:
+            # close() never runs if __init__ raises, so free the block here
+            # rather than leaving it behind in /dev/shm
+            self.memory.close()
+            self.memory.unlink()
+            self.memory = None
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+        if self.memory is not None:
+            self.memory.close()
+            self.memory.unlink()
+            self.memory = None
+
+    def partitions(self):
+        # Split vertex positions into contiguous ranges
+        count = max(self.workers * PARTITIONS_PER_WORKER, 1)
+        size = max(-(-self.num_vertices // count), 1)  # Ceiling division
+        return [(start, min(start + size, self.num_vertices))
+                for start in range(0, self.num_vertices, size)]
+
+    def run(self, analytic, param=None):
+        # Run an analytic on every partition and return the list of results
+        tasks = [(analytic, start, end, param) for start, end in self.partitions()]
+        if self.pool is None:
+            function = PARTITION_ANALYTICS[analytic]
+            return [function(self.offsets, self.targets, start, end, param)
+                    for _, start, end, param in tasks]
+        return self.pool.map(run_partition, tasks)
+
+    def degree_distribution(self):
+        # Returns {"out": {degree: vertices}, "in": {degree: vertices}}
+        out_distribution = Counter()
+        in_counts = Counter()
+        for out_degrees, partial_in in self.run("degrees"):
+            out_distribution.update(out_degrees)
+            in_counts.update(partial_in)
+
+        # Vertices that nobody follows never appear in in_counts
+        in_distribution = Counter(in_counts.values())
+        in_distribution[0] += self.num_vertices - len(in_counts)
+        if in_distribution[0] == 0:
+            del in_distribution[0]
+
+        return {"out": dict(out_distribution), "in": dict(in_distribution)}
+
+    def reachability_counts(self, max_hops=None):
+        # Returns {vertex_id: number of other vertices it can reach}
+        counts = {}
+        for partial in self.run("reachability", max_hops):
+            for position, count in partial.items():
+                counts[self.vertex_ids[position]] = count
+        return counts
+
+    def recommendations(self, k=RECOMMENDATIONS_PER_USER):
+        # Returns {vertex_id: [up to k suggested vertex_ids]}
+        suggestions = {}
+        for partial in self.run("recommendations", k):
+            for position, candidates in partial.items():
+                suggestions[self.vertex_ids[position]] = [self.vertex_ids[c] for c in candidates]
+        return suggestions
+
+
+def parallel_scaling_benchmark(num_vertices=SCALING_BENCHMARK_VERTICES,
+                               average_degree=CLUSTER_BENCHMARK_DEGREE, worker_counts=None):
+    # Time each analytic in one process and then with 1, 2, 4, ... workers
+    cpu_count = os.cpu_count() or 1  # cpu_count() can be None
+    if worker_counts is None:
+        worker_counts = [1]
+        while worker_counts[-1] * 2 <= cpu_count:
+            worker_counts.append(worker_counts[-1] * 2)
+
+    print("\n" + "=" * 70)
+    print("PARALLEL ANALYTICS SCALING BENCHMARK")
+    print("=" * 70)
+    print(f"{num_vertices:,} vertices, about {average_degree} follows per user, "
+          f"{cpu_count} CPU cores available")
+    print("=" * 70)
+
+    graph = build_random_graph(num_vertices, average_degree)
+    analytics = [
+        ("Degree distribution", lambda runner: runner.degree_distribution()),
+        ("Reachability (3 hops)", lambda runner: runner.reachability_counts(max_hops=3)),
+        ("Recommendations", lambda runner: runner.recommendations()),
+    ]
+
+    results = []
+    for workers in [0] + worker_counts:
+        label = "sequential" if workers == 0 else f"{workers} worker(s)"
+        print(f"\n{label}:")
+
+        # Pool start-up and shared memory set-up are not part of the timings
+        with ParallelGraphAnalytics(graph, workers) as runner:
+            for name, analytic in analytics:
+                start = time.perf_counter()
+                analytic(runner)
+                elapsed = time.perf_counter() - start
+
+                baseline = next((r["seconds"] for r in results
+                                 if r["analytic"] == name and r["workers"] == 0), elapsed)
+                speedup = baseline / elapsed
+                print(f"  {name:<24} {elapsed * 1000:10.2f} ms   speedup {speedup:5.2f}x")
+                results.append({"analytic": name, "workers": workers,
+                                "seconds": elapsed, "speedup": speedup})
+
+    print("=" * 70)
+    return results
+
+
+# Synthetic Social Graph Generator
+def generate_follow_edges(num_vertices, follows_per_user=FOLLOWS_PER_NEW_USER, seed=GRAPH_RANDOM_SEED,
+                          follow_back_probability=FOLLOW_BACK_PROBABILITY):
+    # Preferential attachment (Barabasi-Albert style) for a follow graph:
+    # users join one at a time and follow up to follows_per_user existing
+    # users, picking popular accounts more often. The chance of being picked
+    # is proportional to (followers + 1), which gives a power-law follower
+    # distribution. Each followed user follows back with
+    # follow_back_probability, so the graph has mutual follows and cycles
+    # (without them it would have no strongly connected components).
+    # Yields (follower, followed) pairs; same seed, same graph.
+    rng = random.Random(seed)
+
+    # Every user appears once, plus once more for every follower they get,
+    # so a uniform pick from this list is a pick weighted by followers + 1
+    weighted = []
+
+    for vertex in range(num_vertices):
+        follows = min(follows_per_user, vertex)
+        chosen = set()
+        while len(chosen) < follows:
+            chosen.add(weighted[rng.randrange(len(weighted))])
+
+        weighted.append(vertex)
+        for target in sorted(chosen):
+            weighted.append(target)
+            yield vertex, target
+
+            if rng.random() < follow_back_probability:
+                weighted.append(vertex)
+                yield target, vertex
+
+
+def build_power_law_graph(num_vertices, follows_per_user=FOLLOWS_PER_NEW_USER, seed=GRAPH_RANDOM_SEED,
+                          follow_back_probability=FOLLOW_BACK_PROBABILITY):
+    # Graph with integer vertex ids built from generate_follow_edges
+    graph = Graph()
+    for vertex in range(num_vertices):
+        graph.add_vertex(vertex, None)
+    edges = generate_follow_edges(num_vertices, follows_per_user, seed, follow_back_probability)
+    for follower, followed in edges:
+        graph.add_edge(follower, followed)
+    return graph
+
+
+def percentile(sorted_values, fraction):
+    # Nearest-rank percentile of an already sorted list
+    if not sorted_values:
+        return 0
+    rank = max(math.ceil(fraction * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def summarize_latencies(latencies):
+    # Turn per-operation times in nanoseconds into ops/sec and percentiles
+    latencies = sorted(latencies)
+    total = sum(latencies)
+    return {
+        "operations": len(latencies),
+        "ops_per_sec": len(latencies) / (total / 1e9) if total else 0.0,
+        "p50_ns": percentile(latencies, 0.50),
+        "p95_ns": percentile(latencies, 0.95),
+        "p99_ns": percentile(latencies, 0.99),
+        "max_ns": latencies[-1] if latencies else 0,
+    }
+
+
+def time_each(operation, arguments):
+    # Call operation(*args) for every args tuple, timing each call separately
+    latencies = array("q")
+    clock = time.perf_counter_ns
+    for args in arguments:
+        start = clock()
+        operation(*args)
+        latencies.append(clock() - start)
+    return latencies
+
+
+def benchmark_graph_size(num_edges, follows_per_user, sample_operations, seed, follow_back_probability):
+    # Benchmark every Graph operation on one power-law graph size
+    # Each new user adds about follows_per_user × (1 + follow-back chance) edges
+    edges_per_user = follows_per_user * (1 + follow_back_probability)
+    num_vertices = max(int(num_edges / edges_per_user), follows_per_user + 1)
+    edges = list(generate_follow_edges(num_vertices, follows_per_user, seed, follow_back_probability))
+    rng = random.Random(seed)
+
+    graph = Graph()
+    operations = {}
+
+    # Building the graph: every add_vertex and add_edge is timed
+    operations["add_vertex"] = summarize_latencies(
+        time_each(graph.add_vertex, ((vertex, None) for vertex in range(num_vertices))))
+    operations["add_edge"] = summarize_latencies(time_each(graph.add_edge, edges))
+
+    # Queries on random vertices
+    sample_vertices = [(rng.randrange(num_vertices),) for _ in range(sample_operations)]
+    operations["list_outgoing"] = summarize_latencies(
+        time_each(graph.list_outgoing_adjacent_vertices, sample_vertices))
+    operations["list_incoming"] = summarize_latencies(
+        time_each(graph.list_incoming_adjacent_vertices, sample_vertices))
+    operations["followers_page"] = summarize_latencies(
+        time_each(graph.get_incoming_page, sample_vertices))
+
+    # Whole-graph traversal (a single timed run)
+    operations["strongly_connected_components"] = summarize_latencies(
+        time_each(graph.strongly_connected_components, [()]))
+
+    # Removing random existing edges
+    removals = rng.sample(edges, min(sample_operations, len(edges)))
+    operations["remove_edge"] = summarize_latencies(time_each(graph.remove_edge, removals))
+
+    # Peak memory is measured in a separate build so tracing does not slow
+    # down the timings above
+    del graph
+    tracemalloc.start()
+    build_power_law_graph(num_vertices, follows_per_user, seed, follow_back_probability)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "vertices": num_vertices,
+        "edges": len(edges),
+        "peak_memory_bytes": peak,
+        "operations": operations,
+    }
+
+
+def graph_benchmark_suite(edge_counts=SUITE_EDGE_COUNTS, follows_per_user=FOLLOWS_PER_NEW_USER,
+                          sample_operations=SUITE_SAMPLE_OPERATIONS, seed=GRAPH_RANDOM_SEED,
+                          output_path=None, include_large=False,
+                          follow_back_probability=FOLLOW_BACK_PROBABILITY):
+    # Run benchmark_graph_size for every size and report the results as JSON
+    # include_large=True adds SUITE_LARGE_EDGE_COUNTS (10^7 edges needs
+    # about 10 GB of memory)
+    if include_large:
+        edge_counts = list(edge_counts) + SUITE_LARGE_EDGE_COUNTS
+
+    print("\n" + "=" * 70)
+    print("GRAPH BENCHMARK SUITE")
+    print("=" * 70)
+    print(f"Power-law follow graphs, {follows_per_user} follows per new user, "
+          f"{follow_back_probability:.0%} follow-back chance, seed {seed}")
+    print("=" * 70)
+
+    sizes = []
+    for num_edges in edge_counts:
+        result = benchmark_graph_size(num_edges, follows_per_user, sample_operations, seed,
+                                      follow_back_probability)
+        sizes.append(result)
+
+        print(f"\n{result['vertices']:,} vertices, {result['edges']:,} edges "
+              f"(peak {result['peak_memory_bytes'] / 1024 / 1024:.2f} MB):")
+        for name, stats in result["operations"].items():
+            print(f"  {name:<30} {stats['ops_per_sec']:14,.0f} ops/sec   "
+                  f"p50 {stats['p50_ns']:>10,} ns   p99 {stats['p99_ns']:>12,} ns")
+
+    report = {
+        "generator": "preferential_attachment",
+        "follows_per_user": follows_per_user,
+        "follow_back_probability": follow_back_probability,
+        "seed": seed,
+        "sample_operations": sample_operations,
+        "sizes": sizes,
+    }
+
+    report_json = json.dumps(report, indent=2)
+    if output_path is not None:
+        with open(output_path, "w") as file:
+            file.write(report_json)
+        print(f"\n✓ JSON report written to {output_path}")
+    else:
+        print("\n" + report_json)
+
+    print("=" * 70)
+    return report
+
+
 # Main execution
 if __name__ == "__main__":
     print("\n" + "=" * 70)
     print("QUESTION 2: GRAPH DATA STRUCTURE")
     print("=" * 70)
 
+    # Ask if user wants to run the benchmarks first
+    run_benchmark = input("Do you want to run the graph benchmarks first? (y/n): ")
+    if run_benchmark.lower() == 'y':
+        cluster_benchmark()
+        parallel_scaling_benchmark()
+        include_large = input("Include the 10^7-edge graph (needs about 10 GB of memory)? (y/n): ")
+        graph_benchmark_suite(output_path="graph_benchmark.json", include_large=include_large.lower() == 'y')
+
     app = SocialMediaApp()
     app.run()
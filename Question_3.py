@@ -1,10 +1,80 @@
+import asyncio
+import atexit
+import json
+import math
+import operator
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
 import threading
 import time
+from array import array
+from bisect import bisect_right, insort
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# NumPy is optional - only used to speed up building modular tables
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# resource is Unix-only - used to count context switches per thread
+try:
+    import resource
+except ImportError:
+    resource = None
 
 # Constants for better readability
 NUMBER_OF_TEST_ROUNDS = 10  # How many times to repeat the experiment
 FACTORIAL_NUMBERS = [50, 100, 200]  # The factorial values to calculate
 
+# Constants for the process pool factorial engine
+PARALLEL_THRESHOLD = 20_000  # Below this n, one process is faster than a pool
+CHUNKS_PER_WORKER = 4  # Split n! into this many range products per worker
+SMALL_RANGE_SIZE = 16  # Ranges this short are multiplied with a plain loop
+
+# Constants for the factorial algorithm benchmark
+ALGORITHM_BENCHMARK_SIZES = [50, 200, 1_000, 5_000, 20_000, 50_000, 100_000]
+ALGORITHM_BENCHMARK_REPEATS = 3  # Best of this many runs is reported
+
+# Constants for the factorial cache
+CACHE_CHECKPOINTS_PER_CALL = 4  # Extra k! stored below n (at n/2, n/4, ...) per call
+CACHE_MIN_CHECKPOINT = 64  # Smaller k! are cheap to recompute, so not stored
+CACHE_MEMORY_BUDGET = 64 * 1024 * 1024  # Evict old entries above this many bytes
+
+# Constants for the concurrency benchmark harness
+HARNESS_SIZES = [50, 100, 200, 1_000, 10_000]  # Values of n to sweep
+HARNESS_WORKER_COUNTS = [1, 2, 4]  # Number of parallel tasks (one n! each)
+HARNESS_ROUNDS = 20  # Timed rounds per measurement
+HARNESS_WARMUP_ROUNDS = 3  # Untimed rounds before measuring
+FREE_THREADED_INTERPRETERS = ["python3.14t", "python3.13t"]  # GIL-free builds to try
+
+# Constants for the asyncio factorial service
+SERVICE_BATCH_WINDOW = 0.002  # Seconds to collect requests before starting a batch
+SERVICE_BATCH_SPAN = 1_000  # Requests whose n differ by at most this share one batch
+SERVICE_MAX_BATCH_SIZE = 64  # Most distinct n computed by one batch
+SERVICE_LATENCY_SAMPLES = 10_000  # Most recent request latencies kept for metrics
+LOAD_TEST_REQUESTS = 2_000  # Requests sent by the load test
+LOAD_TEST_MAX_N = 3_000  # Largest n used by the load test
+
+# Constants for modular factorial tables
+DEFAULT_MODULUS = 1_000_000_007  # A common prime modulus
+MODULAR_TABLE_LIMIT = 1_000_000  # Precompute n! mod p for n up to this
+NUMPY_MAX_MODULUS = 3_037_000_499  # Largest p where p*p still fits in int64
+ARRAY_MAX_MODULUS = 2**63  # Tables for p at or above this use lists (array("q") is int64)
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)  # Exact for p < 3.3 × 10^24
+MODULAR_BENCHMARK_LIMIT = 2_000  # Largest n used by the modular benchmark
+MODULAR_BENCHMARK_QUERIES = 2_000  # Binomial queries timed by the benchmark
+
+# Constants for thread profiling
+PROFILE_SLICE_SIZE = 25  # Multiplications between two timing samples
+PROFILE_GAP_THRESHOLD_NS = 20_000  # Wall time above CPU time that counts as a gap
+PROFILE_ROUNDS = 3  # Rounds recorded by profile_threads
+
 
 # QUESTION 3.2: Factorial Function with Big-O Analysis
 def calculate_factorial(n):
@@ -20,15 +90,344 @@ def calculate_factorial(n):
     return result
 
 
+# Range products (used by the process pool engine)
+def range_product(low, high):
+    # Multiply low × (low+1) × ... × high by splitting the range in half
+    # and multiplying the two halves. Keeping both sides a similar size lets
+    # Python use its faster big-number multiplication (Karatsuba), which is
+    # much quicker than growing one huge number by one small factor at a time.
+    if low > high:
+        return 1
+
+    if high - low < SMALL_RANGE_SIZE:
+        result = low
+        for i in range(low + 1, high + 1):
+            result *= i
+        return result
+
+    middle = (low + high) // 2
+    return range_product(low, middle) * range_product(middle + 1, high)
+
+
+def multiply_tree(values):
+    # Multiply a list of numbers pairwise, level by level (balanced tree)
+    values = list(values)
+    if not values:
+        return 1
+
+    while len(values) > 1:
+        paired = [values[i] * values[i + 1] for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+
+    return values[0]
+
+
+def split_range(n, parts):
+    # Split 1..n into at most `parts` contiguous (low, high) ranges
+    size = max(-(-n // parts), 1)  # Ceiling division
+    return [(low, min(low + size - 1, n)) for low in range(1, n + 1, size)]
+
+
+# Sub-quadratic factorial algorithms
+def binary_split_factorial(n):
+    # n! as a product tree over 1..n (see range_product)
+    return range_product(1, n)
+
+
+def prime_sieve(n):
+    # Sieve of Eratosthenes: list of all primes <= n
+    if n < 2:
+        return []
+
+    is_prime = bytearray([1]) * (n + 1)
+    is_prime[0] = is_prime[1] = 0
+    for p in range(2, math.isqrt(n) + 1):
+        if is_prime[p]:
+            # Cross out every multiple of p starting from p*p
+            is_prime[p * p::p] = bytearray(len(range(p * p, n + 1, p)))
+
+    return [p for p in range(2, n + 1) if is_prime[p]]
+
+
+def swing(n, primes):
+    # The "swinging factorial" n≀ = n! / (floor(n/2)!)^2, built from its
+    # prime factorisation. The exponent of prime p is the number of odd
+    # values in n // p, n // p^2, n // p^3, ...
+    factors = []
+    for p in primes[:bisect_right(primes, n)]:
+        q = n
+        factor = 1
+        while q:
+            q //= p
+            if q & 1:
+                factor *= p
+        if factor > 1:
+            factors.append(factor)
+
+    return multiply_tree(factors)
+
+
+def prime_swing_factorial(n):
+    # Luschny's prime swing algorithm: n! = (floor(n/2)!)^2 × swing(n)
+    # Squaring and multiplying a few balanced numbers is far cheaper than
+    # multiplying by 1..n one at a time.
+    primes = prime_sieve(n)
+
+    # Work up from the smallest sub-problem instead of recursing
+    sizes = []
+    while n >= 2:
+        sizes.append(n)
+        n //= 2
+
+    result = 1
+    for m in reversed(sizes):
+        result = result * result * swing(m, primes)
+    return result
+
+
+# Every factorial implementation, selectable by name
+FACTORIAL_METHODS = {
+    "naive": calculate_factorial,
+    "binary_split": binary_split_factorial,
+    "prime_swing": prime_swing_factorial,
+    "math": math.factorial,
+}
+
+
+def factorial_algorithm_benchmark(sizes=ALGORITHM_BENCHMARK_SIZES, repeats=ALGORITHM_BENCHMARK_REPEATS):
+    # Time every method on each n and find where the fast methods overtake
+    # the naive loop (the crossover point)
+    print("\n" + "=" * 70)
+    print("FACTORIAL ALGORITHM BENCHMARK")
+    print("=" * 70)
+    print(f"Best of {repeats} runs, times in milliseconds")
+    print("=" * 70)
+
+    names = list(FACTORIAL_METHODS)
+    print(f"{'n':>10}" + "".join(f"{name:>15}" for name in names))
+
+    results = []
+    for n in sizes:
+        times = {}
+        for name in names:
+            function = FACTORIAL_METHODS[name]
+            best = None
+            for _ in range(repeats):
+                start = time.perf_counter_ns()
+                function(n)
+                elapsed = time.perf_counter_ns() - start
+                best = elapsed if best is None else min(best, elapsed)
+            times[name] = best
+
+        results.append({"n": n, "ns": times})
+        print(f"{n:>10,}" + "".join(f"{times[name] / 1_000_000:>15.4f}" for name in names))
+
+    # Crossover: smallest n from which a method stays faster than the naive loop
+    print("-" * 70)
+    for name in names:
+        if name == "naive":
+            continue
+        crossover = None
+        for result in reversed(results):
+            if result["ns"][name] >= result["ns"]["naive"]:
+                break
+            crossover = result["n"]
+
+        if crossover is None:
+            print(f"{name:<15} never faster than the naive loop in this range")
+        else:
+            print(f"{name:<15} faster than the naive loop from n = {crossover:,}")
+
+    print("=" * 70)
+    return results
+
+
+# Process pool factorial engine
+class ParallelFactorialEngine:
+    # Calculates n! on several CPU cores. n! is split into range products
+    # that run in separate processes (each with its own GIL), and the
+    # partial products are combined in a balanced tree.
+    # The pool is created on first use and kept until close(), so process
+    # start-up is paid once rather than on every call.
+
+    def __init__(self, workers=None, threshold=PARALLEL_THRESHOLD):
+        self.workers = workers or os.cpu_count() or 1
+        self.threshold = threshold
+        self.executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        # Shut down the worker processes
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def uses_pool(self, n):
+        # Small n (or a single core) is faster without inter-process overhead
+        return n >= self.threshold and self.workers > 1
+
+    def factorial(self, n):
+        if not self.uses_pool(n):
+            return range_product(1, n)
+
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        ranges = split_range(n, self.workers * CHUNKS_PER_WORKER)
+        lows = [low for low, _ in ranges]
+        highs = [high for _, high in ranges]
+
+        # Results come back in range order; combine them pairwise
+        partials = self.executor.map(range_product, lows, highs)
+        return multiply_tree(partials)
+
+
+# Shared engine so repeated calls reuse the same worker processes
+default_engine = None
+
+
+def parallel_factorial(n):
+    # n! using the shared ParallelFactorialEngine (created on first call)
+    global default_engine
+    if default_engine is None:
+        default_engine = ParallelFactorialEngine()
+        atexit.register(default_engine.close)
+    return default_engine.factorial(n)
+
+
+# Memoized factorial cache with checkpoints
+class FactorialCache:
+    # Remembers factorials so nearby values do not start again from 1.
+    # On the way to n! it stores n! itself plus up to checkpoints_per_call
+    # checkpoints at n/2, n/4, n/8, ... A request for m! then starts from
+    # the largest stored k <= m and only multiplies (k+1) × ... × m.
+    # Each segment is a balanced range_product, and because the checkpoints
+    # double in size, extending through them costs about as much as one
+    # multiplication of the final size (no quadratic growing loop).
+    # Entries are evicted least-recently-used first once their total size
+    # passes memory_budget. A lock protects the cache so threads can share it;
+    # the multiplication itself happens outside the lock.
+
+    def __init__(self, checkpoints_per_call=CACHE_CHECKPOINTS_PER_CALL, memory_budget=CACHE_MEMORY_BUDGET):
+        self.checkpoints_per_call = checkpoints_per_call
+        self.memory_budget = memory_budget
+        self.entries = OrderedDict()  # {k: k!} in least-recently-used order
+        self.keys = []  # Sorted list of stored k, for finding the nearest one
+        self.memory_used = 0  # Total bytes of the stored factorials
+        self.lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0  # n! was stored already
+        self.extensions = 0  # Started from a smaller stored k!
+        self.misses = 0  # Nothing useful stored - started from 1
+        self.evictions = 0
+
+    def factorial(self, n):
+        with self.lock:
+            if n in self.entries:
+                self.hits += 1
+                self.entries.move_to_end(n)
+                return self.entries[n]
+
+            # Nearest stored value below n
+            position = bisect_right(self.keys, n) - 1
+            if position >= 0:
+                self.extensions += 1
+                base = self.keys[position]
+                result = self.entries[base]
+                self.entries.move_to_end(base)
+            else:
+                self.misses += 1
+                base = 0
+                result = 1
+
+        # Checkpoints at n/2, n/4, ... that lie above the starting point
+        checkpoints = []
+        checkpoint = n
+        for _ in range(self.checkpoints_per_call):
+            checkpoint //= 2
+            if checkpoint <= base or checkpoint < CACHE_MIN_CHECKPOINT:
+                break
+            checkpoints.append(checkpoint)
+
+        # Extend from the smallest checkpoint up to n, remembering each one
+        for checkpoint in reversed(checkpoints):
+            result *= range_product(base + 1, checkpoint)
+            base = checkpoint
+            self.store(checkpoint, result)
+
+        result *= range_product(base + 1, n)
+        self.store(n, result)
+        return result
+
+    def store(self, k, value):
+        # Add k! to the cache and evict old entries that no longer fit
+        size = sys.getsizeof(value)
+        if size > self.memory_budget:
+            return  # Would not fit even in an empty cache
+
+        with self.lock:
+            if k in self.entries:
+                return  # Another thread stored it first
+
+            self.entries[k] = value
+            insort(self.keys, k)
+            self.memory_used += size
+
+            while self.memory_used > self.memory_budget:
+                old_k, old_value = self.entries.popitem(last=False)
+                del self.keys[bisect_right(self.keys, old_k) - 1]
+                self.memory_used -= sys.getsizeof(old_value)
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.keys.clear()
+            self.memory_used = 0
+
+    def stats(self):
+        # Hit-rate statistics as a dictionary
+        with self.lock:
+            lookups = self.hits + self.extensions + self.misses
+            return {
+                "lookups": lookups,
+                "hits": self.hits,
+                "extensions": self.extensions,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self.entries),
+                "memory_bytes": self.memory_used,
+            }
+
+
+# Shared cache for cached_factorial
+default_cache = FactorialCache()
+
+
+def cached_factorial(n):
+    # n! through the shared FactorialCache
+    return default_cache.factorial(n)
+
+
 # QUESTION 3.3: Multithreading Implementation
 class FactorialThread(threading.Thread):
     # Custom thread class for calculating factorials
 
-    def __init__(self, n, thread_name):
+    def __init__(self, n, thread_name, factorial_function=calculate_factorial):
         # Initialize the thread
         threading.Thread.__init__(self)
         self.n = n  # The number to calculate factorial for
         self.thread_name = thread_name
+        self.factorial_function = factorial_function  # e.g. cached_factorial
         self.result = None  # Will store the factorial result
         self.start_time = None  # When this thread started
         self.end_time = None  # When this thread finished
@@ -40,13 +439,13 @@ class FactorialThread(threading.Thread):
         self.start_time = time.perf_counter_ns()
 
         # Perform the calculation
-        self.result = calculate_factorial(self.n)
+        self.result = self.factorial_function(self.n)
 
         # Record end time in nanoseconds
         self.end_time = time.perf_counter_ns()
 
 
-def multithreading_test(rounds=NUMBER_OF_TEST_ROUNDS):
+def multithreading_test(rounds=NUMBER_OF_TEST_ROUNDS, factorial_function=calculate_factorial):
     # Test factorial calculation using multithreading (Question 3.3)
 
     print("\n" + "=" * 70)
@@ -63,7 +462,7 @@ def multithreading_test(rounds=NUMBER_OF_TEST_ROUNDS):
         # Step 1: Create one thread for each factorial calculation
         threads = []
         for num in numbers:
-            thread = FactorialThread(num, f"Thread-{num}")
+            thread = FactorialThread(num, f"Thread-{num}", factorial_function)
             threads.append(thread)
 
         # Step 2: Record when we start ALL threads
@@ -107,7 +506,7 @@ def multithreading_test(rounds=NUMBER_OF_TEST_ROUNDS):
 
 
 # QUESTION 3.4: Sequential Execution (Without Multithreading)
-def sequential_test(rounds=NUMBER_OF_TEST_ROUNDS):
+def sequential_test(rounds=NUMBER_OF_TEST_ROUNDS, factorial_function=calculate_factorial):
     # Test factorial calculation WITHOUT multithreading (Question 3.4)
 
     print("\n" + "=" * 70)
@@ -131,7 +530,7 @@ def sequential_test(rounds=NUMBER_OF_TEST_ROUNDS):
         for num in numbers:
             # Time each individual calculation
             individual_start = time.perf_counter_ns()
-            result = calculate_factorial(num)
+            result = factorial_function(num)
             individual_end = time.perf_counter_ns()
 
             results.append(result)
@@ -203,6 +602,822 @@ def compare_performance():
     print("=" * 70)
 
 
+# Concurrency Benchmark Harness
+# Every measurement runs `workers` copies of n! and is repeated for several
+# rounds after a warmup. Pools are created before timing starts, so the
+# "threads" and "processes" rows show the cost of the work itself; creating
+# threads is measured on its own in "thread_overhead" (threads that do
+# nothing) and "threads_spawn" (a new FactorialThread per task, like
+# multithreading_test). Nothing is printed while timing.
+
+def run_sequential(tasks, factorial_function, executor):
+    for n in tasks:
+        factorial_function(n)
+
+
+def run_on_executor(tasks, factorial_function, executor):
+    list(executor.map(factorial_function, tasks))
+
+
+def run_spawned_threads(tasks, factorial_function, executor):
+    threads = [FactorialThread(n, f"Thread-{i}", factorial_function) for i, n in enumerate(tasks)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def do_nothing():
+    pass
+
+
+def run_empty_threads(tasks, factorial_function, executor):
+    threads = [threading.Thread(target=do_nothing) for _ in tasks]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+# Mode name -> (runner, which executor it needs)
+HARNESS_MODES = {
+    "sequential": (run_sequential, None),
+    "threads": (run_on_executor, "threads"),
+    "threads_spawn": (run_spawned_threads, None),
+    "thread_overhead": (run_empty_threads, None),
+    "processes": (run_on_executor, "processes"),
+}
+
+
+def gil_enabled():
+    # False only on a free-threaded (no-GIL) interpreter with the GIL off
+    check = getattr(sys, "_is_gil_enabled", None)
+    return True if check is None else check()
+
+
+def harness_measurements(sizes, worker_counts, rounds, warmup, modes, factorial_function=calculate_factorial):
+    # Time every mode for every (n, workers) pair
+    # Returns a list of rows with the median and p95 time in nanoseconds
+    rows = []
+
+    for workers in worker_counts:
+        executors = {}
+        if any(HARNESS_MODES[mode][1] == "threads" for mode in modes):
+            executors["threads"] = ThreadPoolExecutor(max_workers=workers)
+        if any(HARNESS_MODES[mode][1] == "processes" for mode in modes):
+            executors["processes"] = ProcessPoolExecutor(max_workers=workers)
+
+        try:
+            for n in sizes:
+                tasks = [n] * workers
+                for mode in modes:
+                    runner, executor_name = HARNESS_MODES[mode]
+                    executor = executors.get(executor_name)
+
+                    for _ in range(warmup):
+                        runner(tasks, factorial_function, executor)
+
+                    times = []
+                    for _ in range(rounds):
+                        start = time.perf_counter_ns()
+                        runner(tasks, factorial_function, executor)
+                        times.append(time.perf_counter_ns() - start)
+
+                    times.sort()
+                    rows.append({
+                        "mode": mode,
+                        "n": n,
+                        "workers": workers,
+                        "median_ns": statistics.median(times),
+                        "p95_ns": times[max(math.ceil(0.95 * len(times)), 1) - 1],
+                    })
+        finally:
+            for executor in executors.values():
+                executor.shutdown()
+
+    return rows
+
+
+def free_threaded_measurements(sizes, worker_counts, rounds, warmup):
+    # Run the sequential and thread modes under a free-threaded Python if
+    # one is installed. Returns (interpreter_name, rows) or (None, [])
+    for name in FREE_THREADED_INTERPRETERS:
+        executable = shutil.which(name)
+        if executable is None:
+            continue
+
+        module = os.path.splitext(os.path.basename(__file__))[0]
+        code = (
+            f"import json, {module} as q; "
+            f"print(json.dumps(q.harness_measurements({sizes!r}, {worker_counts!r}, "
+            f"{rounds}, {warmup}, ['sequential', 'threads'])))"
+        )
+        # PYTHON_GIL=0 keeps the GIL off even if an extension asks for it
+        environment = dict(os.environ, PYTHON_GIL="0")
+        completed = subprocess.run(
+            [executable, "-c", code],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            env=environment,
+            capture_output=True,
+            text=True,
+        )
+        if completed.returncode != 0:
+            print(f"✗ {name} failed: {completed.stderr.strip()}")
+            continue
+
+        return name, json.loads(completed.stdout)
+
+    return None, []
+
+
+def add_speedups(rows):
+    # Speedup = sequential median / mode median for the same interpreter,
+    # n and workers; parallel efficiency = speedup / workers
+    baselines = {
+        (row["interpreter"], row["n"], row["workers"]): row["median_ns"]
+        for row in rows if row["mode"] == "sequential"
+    }
+
+    for row in rows:
+        if row["mode"] == "thread_overhead":
+            row["speedup"] = None  # Does no factorial work, nothing to compare
+            row["efficiency"] = None
+            continue
+        if row["mode"] == "sequential":
+            row["speedup"] = 1.0  # The baseline itself
+            row["efficiency"] = None  # Uses one core whatever the task count
+            continue
+        baseline = baselines[(row["interpreter"], row["n"], row["workers"])]
+        row["speedup"] = baseline / row["median_ns"] if row["median_ns"] else None
+        row["efficiency"] = row["speedup"] / row["workers"] if row["speedup"] else None
+
+
+def format_harness_table(rows):
+    # Plain text table of the harness results
+    lines = [
+        f"{'interpreter':<14}{'mode':<17}{'n':>8}{'workers':>9}"
+        f"{'median ms':>12}{'p95 ms':>12}{'speedup':>9}{'effic.':>8}",
+        "-" * 89,
+    ]
+    for row in rows:
+        speedup = "-" if row["speedup"] is None else f"{row['speedup']:.2f}x"
+        efficiency = "-" if row["efficiency"] is None else f"{row['efficiency'] * 100:.0f}%"
+        lines.append(
+            f"{row['interpreter']:<14}{row['mode']:<17}{row['n']:>8,}{row['workers']:>9}"
+            f"{row['median_ns'] / 1_000_000:>12.4f}{row['p95_ns'] / 1_000_000:>12.4f}"
+            f"{speedup:>9}{efficiency:>8}"
+        )
+    return "\n".join(lines)
+
+
+def concurrency_benchmark(sizes=HARNESS_SIZES, worker_counts=HARNESS_WORKER_COUNTS,
+                          rounds=HARNESS_ROUNDS, warmup=HARNESS_WARMUP_ROUNDS, output_path=None):
+    # Compare sequential, threads, processes and (if installed) free-threaded
+    # Python. Prints a text table and returns the report; the report is also
+    # written as JSON to output_path if given.
+    print("\n" + "=" * 70)
+    print("CONCURRENCY BENCHMARK HARNESS")
+    print("=" * 70)
+    print(f"n = {sizes}, workers = {worker_counts}, {rounds} rounds after {warmup} warmup")
+    print("=" * 70)
+
+    interpreter = "current" if gil_enabled() else "current (no GIL)"
+    rows = harness_measurements(sizes, worker_counts, rounds, warmup, list(HARNESS_MODES))
+    for row in rows:
+        row["interpreter"] = interpreter
+
+    free_threaded_name, free_threaded_rows = free_threaded_measurements(sizes, worker_counts, rounds, warmup)
+    for row in free_threaded_rows:
+        row["interpreter"] = free_threaded_name
+    rows.extend(free_threaded_rows)
+
+    add_speedups(rows)
+
+    print(format_harness_table(rows))
+
+    report = {
+        "python_version": sys.version.split()[0],
+        "gil_enabled": gil_enabled(),
+        "cpu_count": os.cpu_count(),
+        "free_threaded_interpreter": free_threaded_name,
+        "sizes": sizes,
+        "worker_counts": worker_counts,
+        "rounds": rounds,
+        "warmup_rounds": warmup,
+        "results": rows,
+    }
+
+    if output_path is not None:
+        with open(output_path, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"\n✓ JSON report written to {output_path}")
+
+    print("=" * 70)
+    return report
+
+
+# Asyncio Factorial Service
+def batch_factorials(sorted_ns):
+    # Factorials of an ascending list of n in one pass: each result extends
+    # the previous one, so the shared product is only calculated once
+    results = []
+    value = 1
+    previous = 0
+    for n in sorted_ns:
+        value *= range_product(previous + 1, n)
+        previous = n
+        results.append(value)
+    return results
+
+
+def group_nearby(sorted_ns, span, max_size=SERVICE_MAX_BATCH_SIZE):
+    # Split an ascending list into groups where largest - smallest <= span
+    # and no group has more than max_size values. Separate groups are
+    # computed independently, so small n do not wait behind the largest.
+    groups = []
+    for n in sorted_ns:
+        if groups and n - groups[-1][0] <= span and len(groups[-1]) < max_size:
+            groups[-1].append(n)
+        else:
+            groups.append([n])
+    return groups
+
+
+class FactorialService:
+    # Non-blocking factorial, binomial and permutation queries for asyncio.
+    # - The multiplication runs on an executor, never on the event loop
+    #   (executor=None uses the loop's default thread pool; a
+    #   ProcessPoolExecutor also works and uses several cores).
+    # - Identical requests that are already in flight share one result.
+    # - Requests arriving within batch_window are sorted and split into
+    #   batches spanning at most batch_span; each batch is computed by
+    #   batch_factorials and separate batches run concurrently.
+
+    def __init__(self, executor=None, batch_window=SERVICE_BATCH_WINDOW, batch_span=SERVICE_BATCH_SPAN,
+                 max_batch_size=SERVICE_MAX_BATCH_SIZE):
+        self.executor = executor
+        self.batch_window = batch_window
+        self.batch_span = batch_span
+        self.max_batch_size = max_batch_size
+
+        self.in_flight = {}  # {n: asyncio.Future} waiting or being computed
+        self.pending = []  # n waiting for the next batch
+        self.flush_task = None
+        self.computing = 0  # n currently being computed on the executor
+
+        # Metrics
+        self.requests = 0
+        self.coalesced = 0  # Requests that joined an in-flight computation
+        self.batches = 0
+        self.latencies = deque(maxlen=SERVICE_LATENCY_SAMPLES)  # Nanoseconds
+
+    async def factorial(self, n):
+        # Validate before queueing: a bad n inside a batch would fail every
+        # other request computed with it
+        n = operator.index(n)
+        if n < 0:
+            raise ValueError("n must not be negative")
+
+        start = time.perf_counter_ns()
+        self.requests += 1
+
+        future = self.in_flight.get(n)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self.in_flight[n] = future
+            self.pending.append(n)
+            if self.flush_task is None:
+                self.flush_task = loop.create_task(self.flush_after_window())
+
+        try:
+            # shield: one caller being cancelled must not cancel the others
+            return await asyncio.shield(future)
+        finally:
+            self.latencies.append(time.perf_counter_ns() - start)
+
+    async def binomial(self, n, k):
+        # C(n, k) = n! / (k! × (n-k)!)
+        n = operator.index(n)
+        k = operator.index(k)
+        if n < 0 or k < 0:
+            raise ValueError("n and k must not be negative")
+        if k > n:
+            return 0
+        n_factorial, k_factorial, rest_factorial = await asyncio.gather(
+            self.factorial(n), self.factorial(k), self.factorial(n - k))
+        return n_factorial // (k_factorial * rest_factorial)
+
+    async def permutations(self, n, k):
+        # P(n, k) = n! / (n-k)!
+        n = operator.index(n)
+        k = operator.index(k)
+        if n < 0 or k < 0:
+            raise ValueError("n and k must not be negative")
+        if k > n:
+            return 0
+        n_factorial, rest_factorial = await asyncio.gather(self.factorial(n), self.factorial(n - k))
+        return n_factorial // rest_factorial
+
+    async def flush_after_window(self):
+        # Wait for more requests, then compute everything pending in batches
+        await asyncio.sleep(self.batch_window)
+        self.flush_task = None
+
+        pending = sorted(self.pending)
+        self.pending = []
+        batches = group_nearby(pending, self.batch_span, self.max_batch_size)
+        await asyncio.gather(*(self.run_batch(batch) for batch in batches))
+
+    async def run_batch(self, batch):
+        loop = asyncio.get_running_loop()
+        self.batches += 1
+        self.computing += len(batch)
+
+        try:
+            results = await loop.run_in_executor(self.executor, batch_factorials, batch)
+        except Exception as error:
+            for n in batch:
+                self.in_flight.pop(n).set_exception(error)
+        except BaseException:
+            # Cancelled: release the waiters so these n leave in_flight and
+            # later requests for them start a fresh computation
+            for n in batch:
+                self.in_flight.pop(n).cancel()
+            raise
+        else:
+            for n, result in zip(batch, results):
+                self.in_flight.pop(n).set_result(result)
+        finally:
+            self.computing -= len(batch)
+
+    def stats(self):
+        # Queue depth, coalescing and latency metrics as a dictionary
+        latencies = sorted(self.latencies)
+
+        def latency_ms(fraction):
+            if not latencies:
+                return 0.0
+            return latencies[max(math.ceil(fraction * len(latencies)), 1) - 1] / 1_000_000
+
+        return {
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "batches": self.batches,
+            "queue_depth": len(self.pending),
+            "computing": self.computing,
+            "p50_ms": latency_ms(0.50),
+            "p95_ms": latency_ms(0.95),
+            "p99_ms": latency_ms(0.99),
+            "max_ms": latencies[-1] / 1_000_000 if latencies else 0.0,
+        }
+
+
+async def direct_binomial(n, k):
+    # Baseline for the load test: every request computes its own factorials
+    loop = asyncio.get_running_loop()
+    n_factorial, k_factorial, rest_factorial = await asyncio.gather(
+        loop.run_in_executor(None, calculate_factorial, n),
+        loop.run_in_executor(None, calculate_factorial, k),
+        loop.run_in_executor(None, calculate_factorial, n - k),
+    )
+    return n_factorial // (k_factorial * rest_factorial)
+
+
+async def service_load_test(requests=LOAD_TEST_REQUESTS, max_n=LOAD_TEST_MAX_N, seed=42):
+    # Fire many concurrent binomial requests (with repeats, as real traffic
+    # has) at the service and at the direct baseline, and compare
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(requests):
+        n = rng.randrange(max_n // 10, max_n + 1, 10)  # Coarse grid so values repeat
+        queries.append((n, rng.randint(0, n)))
+
+    print("\n" + "=" * 70)
+    print("ASYNC FACTORIAL SERVICE LOAD TEST")
+    print("=" * 70)
+    print(f"{requests:,} concurrent binomial requests, n up to {max_n:,}")
+    print("=" * 70)
+
+    start = time.perf_counter()
+    baseline = await asyncio.gather(*(direct_binomial(n, k) for n, k in queries))
+    direct_time = time.perf_counter() - start
+
+    service = FactorialService()
+    start = time.perf_counter()
+    results = await asyncio.gather(*(service.binomial(n, k) for n, k in queries))
+    service_time = time.perf_counter() - start
+
+    if results != baseline:
+        raise RuntimeError("Service results do not match the direct calculation")
+
+    stats = service.stats()
+    print(f"Direct (no coalescing):  {direct_time * 1000:10.2f} ms  "
+          f"({requests / direct_time:,.0f} requests/sec)")
+    print(f"FactorialService:        {service_time * 1000:10.2f} ms  "
+          f"({requests / service_time:,.0f} requests/sec)")
+    print("-" * 70)
+    print(f"Factorial requests: {stats['requests']:,}, coalesced: {stats['coalesced']:,}, "
+          f"batches: {stats['batches']:,}")
+    print(f"Latency p50 {stats['p50_ms']:.2f} ms, p95 {stats['p95_ms']:.2f} ms, "
+          f"p99 {stats['p99_ms']:.2f} ms, max {stats['max_ms']:.2f} ms")
+    print("=" * 70)
+
+    return {"direct_seconds": direct_time, "service_seconds": service_time, "service": stats}
+
+
+# Modular Factorial and Binomial Tables
+def is_prime(p):
+    # Miller-Rabin with fixed bases: O(log^3 p), so 2^61 - 1 takes microseconds.
+    # Deterministic for p < 3.3 × 10^24; above that a composite that passes
+    # every base is possible in theory but none is known.
+    if p < 2:
+        return False
+    for base in MILLER_RABIN_BASES:
+        if p % base == 0:
+            return p == base
+
+    # p - 1 = d × 2^s with d odd
+    d = p - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for base in MILLER_RABIN_BASES:
+        x = pow(base, d, p)
+        if x == 1 or x == p - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % p
+            if x == p - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def prefix_products_mod(values, p):
+    # Running product of a NumPy int64 array mod p, done with whole-array
+    # operations: after the step with shift s, every entry holds the product
+    # of the 2s values ending at it, so log2(n) steps cover everything.
+    # Every operand is < p, so each product fits in int64 if p < NUMPY_MAX_MODULUS.
+    result = values % p
+    shift = 1
+    while shift < len(result):
+        result[shift:] = result[shift:] * result[:-shift] % p
+        shift *= 2
+    return result
+
+
+class ModularFactorialTable:
+    # n! mod p, 1/n! mod p and C(n, k) mod p for a prime p.
+    # Building the tables up to `limit` costs O(limit); afterwards factorial
+    # and binomial lookups with n <= limit are O(1). Larger n still work:
+    #   - n >= p: n! contains the factor p, so n! mod p = 0
+    #   - limit < n < p: extend from the top of the table, or work down from
+    #     Wilson's theorem (p-1)! = -1 (mod p), whichever is shorter
+    #   - binomials with n > limit use Lucas' theorem on the base-p digits
+
+    def __init__(self, p=DEFAULT_MODULUS, limit=MODULAR_TABLE_LIMIT, use_numpy=True):
+        if not is_prime(p):
+            raise ValueError(f"Modulus {p} must be prime")
+
+        self.p = p
+        self.limit = min(limit, p - 1)  # Above p - 1 every entry would be 0
+
+        if use_numpy and numpy is not None and p < NUMPY_MAX_MODULUS:
+            self.build_with_numpy()
+        else:
+            self.build_with_python()
+
+    def build_with_python(self):
+        p = self.p
+        limit = self.limit
+
+        # array("q") holds int64, so residues of a larger p need a plain list
+        if p < ARRAY_MAX_MODULUS:
+            self.factorials = array("q", [1]) * (limit + 1)
+            self.inverse_factorials = array("q", [1]) * (limit + 1)
+        else:
+            self.factorials = [1] * (limit + 1)
+            self.inverse_factorials = [1] * (limit + 1)
+
+        for i in range(1, limit + 1):
+            self.factorials[i] = self.factorials[i - 1] * i % p
+
+        # One modular inverse (Fermat), then walk down: 1/(i-1)! = i × 1/i!
+        self.inverse_factorials[limit] = pow(self.factorials[limit], p - 2, p)
+        for i in range(limit, 0, -1):
+            self.inverse_factorials[i - 1] = self.inverse_factorials[i] * i % p
+
+    def build_with_numpy(self):
+        p = self.p
+        limit = self.limit
+
+        numbers = numpy.arange(limit + 1, dtype=numpy.int64)
+        numbers[0] = 1
+        self.factorials = prefix_products_mod(numbers, p)
+
+        # 1/i! = 1/limit! × (i+1) × ... × limit, a running product from the top
+        top_inverse = pow(int(self.factorials[limit]), p - 2, p)
+        shifted = numpy.append(numbers[1:][::-1], top_inverse)  # limit, ..., 1, 1/limit!
+        suffix = prefix_products_mod(shifted, p)
+        self.inverse_factorials = numpy.empty(limit + 1, dtype=numpy.int64)
+        self.inverse_factorials[limit] = top_inverse
+        # suffix[j] (j < limit) is limit × ... × (limit - j); needs × 1/limit!
+        if limit:
+            self.inverse_factorials[:limit] = suffix[:limit][::-1] * top_inverse % p
+
+    def factorial(self, n):
+        # n! mod p
+        p = self.p
+        if n < 0:
+            raise ValueError("n must not be negative")
+        if n >= p:
+            return 0
+        if n <= self.limit:
+            return int(self.factorials[n])
+
+        if n - self.limit <= p - 1 - n:
+            # Extend from the largest value in the table
+            result = int(self.factorials[self.limit])
+            for i in range(self.limit + 1, n + 1):
+                result = result * i % p
+            return result
+
+        # Wilson: n! × (n+1) × ... × (p-1) = -1 (mod p)
+        tail = 1
+        for i in range(n + 1, p):
+            tail = tail * i % p
+        return (p - 1) * pow(tail, p - 2, p) % p
+
+    def inverse_factorial(self, n):
+        # 1/n! mod p (only defined for n < p)
+        if n < 0 or n >= self.p:
+            raise ValueError(f"1/n! mod {self.p} needs 0 <= n < {self.p}")
+        if n <= self.limit:
+            return int(self.inverse_factorials[n])
+        return pow(self.factorial(n), self.p - 2, self.p)
+
+    def small_binomial(self, n, k):
+        # C(n, k) mod p for 0 <= k <= n < p
+        p = self.p
+        if n <= self.limit:
+            return int(self.factorials[n]) * int(self.inverse_factorials[k]) % p * int(self.inverse_factorials[n - k]) % p
+        return self.factorial(n) * self.inverse_factorial(k) % p * self.inverse_factorial(n - k) % p
+
+    def binomial(self, n, k):
+        # C(n, k) mod p
+        if k < 0 or k > n:
+            return 0
+        if n < self.p:
+            return self.small_binomial(n, k)
+
+        # Lucas: C(n, k) = product of C(n_i, k_i) over the base-p digits
+        p = self.p
+        result = 1
+        while n and result:
+            n_digit, k_digit = n % p, k % p
+            if k_digit > n_digit:
+                return 0
+            result = result * self.small_binomial(n_digit, k_digit) % p
+            n //= p
+            k //= p
+        return result
+
+
+def modular_benchmark(limit=MODULAR_BENCHMARK_LIMIT, queries=MODULAR_BENCHMARK_QUERIES, p=DEFAULT_MODULUS):
+    # Compare C(n, k) mod p from the tables with the full big integer
+    # calculation (calculate_factorial, then reduce)
+    print("\n" + "=" * 70)
+    print("MODULAR BINOMIAL BENCHMARK")
+    print("=" * 70)
+    print(f"{queries:,} queries C(n, k) mod {p:,} with n up to {limit:,}")
+    print("=" * 70)
+
+    rng = random.Random(42)
+    pairs = []
+    for _ in range(queries):
+        n = rng.randint(0, limit)
+        pairs.append((n, rng.randint(0, n)))
+
+    # Table set-up, with and without NumPy
+    start = time.perf_counter()
+    table = ModularFactorialTable(p, limit, use_numpy=False)
+    python_setup = time.perf_counter() - start
+    print(f"Table set-up (Python):   {python_setup * 1000:10.4f} ms")
+
+    numpy_table = None
+    if numpy is None:
+        print("Table set-up (NumPy):    skipped (NumPy not installed)")
+    elif p >= NUMPY_MAX_MODULUS:
+        print("Table set-up (NumPy):    skipped (modulus too large for int64 products)")
+    else:
+        start = time.perf_counter()
+        numpy_table = ModularFactorialTable(p, limit, use_numpy=True)
+        numpy_setup = time.perf_counter() - start
+        print(f"Table set-up (NumPy):    {numpy_setup * 1000:10.4f} ms")
+
+    start = time.perf_counter()
+    fast = [table.binomial(n, k) for n, k in pairs]
+    table_time = time.perf_counter() - start
+
+    # Lookups on the NumPy table convert each int64 back to a Python int
+    if numpy_table is not None:
+        start = time.perf_counter()
+        numpy_fast = [numpy_table.binomial(n, k) for n, k in pairs]
+        numpy_table_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    naive = [calculate_factorial(n) // (calculate_factorial(k) * calculate_factorial(n - k)) % p
+             for n, k in pairs]
+    naive_time = time.perf_counter() - start
+
+    if fast != naive or (numpy_table is not None and numpy_fast != naive):
+        raise RuntimeError("Table results do not match the naive calculation")
+
+    print(f"Table queries (Python):  {table_time * 1000:10.4f} ms "
+          f"({table_time / queries * 1e9:,.0f} ns per query)")
+    if numpy_table is not None:
+        print(f"Table queries (NumPy):   {numpy_table_time * 1000:10.4f} ms "
+              f"({numpy_table_time / queries * 1e9:,.0f} ns per query)")
+    print(f"Naive big integers:      {naive_time * 1000:10.4f} ms "
+          f"({naive_time / queries * 1e9:,.0f} ns per query)")
+    print("-" * 70)
+    print(f"✓ Python tables are {naive_time / table_time:.1f}x faster per query "
+          f"({naive_time / (table_time + python_setup):.1f}x including set-up)")
+    print("=" * 70)
+
+    results = {"python_setup_seconds": python_setup, "table_seconds": table_time, "naive_seconds": naive_time}
+    if numpy_table is not None:
+        results["numpy_setup_seconds"] = numpy_setup
+        results["numpy_table_seconds"] = numpy_table_time
+    return results
+
+
+# Thread Profiling and Timeline Instrumentation
+def thread_context_switches():
+    # (voluntary, involuntary) context switches of the calling thread so far,
+    # or None where the OS cannot report them per thread (needs Linux)
+    if resource is None or not hasattr(resource, "RUSAGE_THREAD"):
+        return None
+    usage = resource.getrusage(resource.RUSAGE_THREAD)
+    return usage.ru_nvcsw, usage.ru_nivcsw
+
+
+class ProfiledFactorialThread(FactorialThread):
+    # FactorialThread that records where its time goes. The factorial loop
+    # (same as calculate_factorial) is cut into slices of slice_size
+    # multiplications, and each slice records wall time and this thread's CPU
+    # time. When wall time is well above CPU time the thread was runnable but
+    # not running - waiting for the GIL or for the OS scheduler - and the
+    # slice is counted as a scheduling gap.
+
+    def __init__(self, n, thread_name, slice_size=PROFILE_SLICE_SIZE):
+        FactorialThread.__init__(self, n, thread_name)
+        self.slice_size = slice_size
+        self.start_called = None  # When start() was called
+        self.cpu_time = None  # CPU time used by run(), in nanoseconds
+        self.context_switches = None  # (voluntary, involuntary) during run()
+        self.slices = []  # (wall_start, wall_end, cpu_ns) for each slice
+
+    def start(self):
+        self.start_called = time.perf_counter_ns()
+        FactorialThread.start(self)
+
+    def run(self):
+        # CPU readings sit inside the wall clock readings so cpu <= wall
+        switches_before = thread_context_switches()
+        self.start_time = time.perf_counter_ns()
+        cpu_before = time.thread_time_ns()
+
+        result = 1
+        for low in range(1, self.n + 1, self.slice_size):
+            wall_start = time.perf_counter_ns()
+            cpu_start = time.thread_time_ns()
+
+            for i in range(low, min(low + self.slice_size, self.n + 1)):
+                result *= i
+
+            self.slices.append((wall_start, time.perf_counter_ns(), time.thread_time_ns() - cpu_start))
+
+        self.result = result
+        self.cpu_time = time.thread_time_ns() - cpu_before
+        self.end_time = time.perf_counter_ns()
+
+        switches_after = thread_context_switches()
+        if switches_before is not None:
+            self.context_switches = (switches_after[0] - switches_before[0],
+                                     switches_after[1] - switches_before[1])
+
+    def gaps(self):
+        # (wall_start, wall_end, waiting_ns) for slices with a scheduling gap
+        return [(start, end, (end - start) - cpu) for start, end, cpu in self.slices
+                if (end - start) - cpu > PROFILE_GAP_THRESHOLD_NS]
+
+    def summary(self):
+        wall = self.end_time - self.start_time
+        gaps = self.gaps()
+        return {
+            "thread": self.thread_name,
+            "n": self.n,
+            "start_latency_ns": self.start_time - self.start_called,
+            "wall_ns": wall,
+            "cpu_ns": self.cpu_time,
+            "cpu_share": self.cpu_time / wall if wall else 0.0,
+            "waiting_ns": max(wall - self.cpu_time, 0),
+            "gaps": len(gaps),
+            "largest_gap_ns": max((waiting for _, _, waiting in gaps), default=0),
+            "voluntary_switches": self.context_switches[0] if self.context_switches else None,
+            "involuntary_switches": self.context_switches[1] if self.context_switches else None,
+        }
+
+
+def trace_events(round_num, threads, origin):
+    # Chrome trace events (chrome://tracing or ui.perfetto.dev) for one round.
+    # Each round is its own "process"; every thread gets a row with its
+    # start latency, its compute slices and its scheduling gaps.
+    # Trace timestamps are microseconds from origin.
+    def micros(ns):
+        return (ns - origin) / 1000
+
+    events = [{"name": "process_name", "ph": "M", "pid": round_num, "tid": 0,
+               "args": {"name": f"Round {round_num}"}}]
+
+    for tid, thread in enumerate(threads, 1):
+        events.append({"name": "thread_name", "ph": "M", "pid": round_num, "tid": tid,
+                       "args": {"name": f"{thread.thread_name} ({thread.n}!)"}})
+        events.append({"name": "waiting to start", "cat": "scheduling", "ph": "X",
+                       "pid": round_num, "tid": tid, "ts": micros(thread.start_called),
+                       "dur": (thread.start_time - thread.start_called) / 1000})
+
+        for wall_start, wall_end, cpu in thread.slices:
+            waiting = (wall_end - wall_start) - cpu
+            is_gap = waiting > PROFILE_GAP_THRESHOLD_NS
+            events.append({"name": "waiting (GIL/scheduler)" if is_gap else "compute",
+                           "cat": "scheduling" if is_gap else "compute", "ph": "X",
+                           "pid": round_num, "tid": tid, "ts": micros(wall_start),
+                           "dur": (wall_end - wall_start) / 1000,
+                           "args": {"cpu_us": cpu / 1000, "waiting_us": max(waiting, 0) / 1000}})
+
+    return events
+
+
+def profile_threads(rounds=PROFILE_ROUNDS, numbers=FACTORIAL_NUMBERS, trace_path=None):
+    # Run the multithreading test with ProfiledFactorialThread and report
+    # CPU time against wall time for every thread. The timeline of all
+    # rounds is written as Chrome trace JSON to trace_path if given.
+    print("\n" + "=" * 70)
+    print("THREAD PROFILING")
+    print("=" * 70)
+    if thread_context_switches() is None:
+        print("(Context switch counts are not available on this platform)")
+
+    origin = time.perf_counter_ns()
+    events = []
+    summaries = []
+
+    for round_num in range(1, rounds + 1):
+        threads = [ProfiledFactorialThread(num, f"Thread-{num}") for num in numbers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        events.extend(trace_events(round_num, threads, origin))
+
+        print(f"\nRound {round_num}:")
+        print(f"  {'thread':<12}{'start wait':>12}{'wall':>12}{'cpu':>12}{'cpu %':>8}"
+              f"{'gaps':>6}{'switches':>10}")
+        for thread in threads:
+            summary = thread.summary()
+            summary["round"] = round_num
+            summaries.append(summary)
+
+            switches = "-"
+            if summary["voluntary_switches"] is not None:
+                switches = f"{summary['voluntary_switches']}/{summary['involuntary_switches']}"
+            print(f"  {summary['thread']:<12}"
+                  f"{summary['start_latency_ns'] / 1000:>10.1f}us"
+                  f"{summary['wall_ns'] / 1000:>10.1f}us"
+                  f"{summary['cpu_ns'] / 1000:>10.1f}us"
+                  f"{summary['cpu_share'] * 100:>7.0f}%"
+                  f"{summary['gaps']:>6}{switches:>10}")
+
+    print("\n(switches = voluntary/involuntary context switches during the thread)")
+
+    if trace_path is not None:
+        with open(trace_path, "w") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ns"}, file)
+        print(f"✓ Timeline written to {trace_path} (open in chrome://tracing or ui.perfetto.dev)")
+
+    print("=" * 70)
+    return summaries, events
+
+
 # Main execution
 if __name__ == "__main__":
     print("\n" + "=" * 70)
@@ -212,4 +1427,30 @@ if __name__ == "__main__":
     # Run performance comparison
     compare_performance()
 
+    # Ask if user wants to compare the factorial algorithms as well
+    print("\n")
+    run_algorithms = input("Do you want to run the factorial algorithm benchmark? (y/n): ")
+    if run_algorithms.lower() == 'y':
+        factorial_algorithm_benchmark()
+
+    # Ask if user wants the detailed concurrency benchmark
+    run_harness = input("Do you want to run the concurrency benchmark harness? (y/n): ")
+    if run_harness.lower() == 'y':
+        concurrency_benchmark(output_path="concurrency_benchmark.json")
+
+    # Ask if user wants the asyncio service load test
+    run_load_test = input("Do you want to run the async factorial service load test? (y/n): ")
+    if run_load_test.lower() == 'y':
+        asyncio.run(service_load_test())
+
+    # Ask if user wants the modular arithmetic benchmark
+    run_modular = input("Do you want to run the modular binomial benchmark? (y/n): ")
+    if run_modular.lower() == 'y':
+        modular_benchmark()
+
+    # Ask if user wants a per-thread profile of the multithreading test
+    run_profile = input("Do you want to profile the factorial threads? (y/n): ")
+    if run_profile.lower() == 'y':
+        profile_threads(trace_path="factorial_trace.json")
+
     print("\n✓ Program completed!")
\ No newline at end of file